@@ -106,7 +106,7 @@ _logger = logging.getLogger("spicelib.SimBatch")
 from spicelib.editor.spice_editor import SpiceEditor
 from spicelib.sim.simulator import Simulator
 from spicelib.sim.run_task import RunTask
-from spicelib.sim.sim_runner import SimRunner
+from .sim_runner import SimRunner
 
 END_LINE_TERM = '\n'
 
@@ -124,16 +124,14 @@ class SimCommander(SpiceEditor):
 
     def __init__(self, netlist_file: Union[str, Path], parallel_sims: int = 4, timeout=None, verbose=False,
                  encoding='autodetect', simulator=None):
-        if simulator is None:
-            from ..sim.ltspice_simulator import LTspice  # In case no simulator is given
-            simulator = LTspice
         netlist_file = Path(netlist_file)
         self.netlist_file = netlist_file  # Legacy property
-        if netlist_file.suffix == '.asc':
-            netlist_file = simulator.create_netlist(netlist_file)
-        super().__init__(netlist_file, encoding)
+        # The runner resolves the simulator, which can also be given as a path to the executable.
         self.runner = SimRunner(simulator=simulator, parallel_sims=parallel_sims, timeout=timeout, verbose=verbose,
                                 output_folder=netlist_file.parent.as_posix())
+        if netlist_file.suffix == '.asc':
+            netlist_file = self.runner.simulator.create_netlist(netlist_file)
+        super().__init__(netlist_file, encoding)
 
     def setLTspiceRunCommand(self, spice_tool: Union[str, Type[Simulator]]) -> None:
         """
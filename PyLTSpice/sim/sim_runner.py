@@ -99,7 +99,7 @@ __all__ = ['SimRunner']
 from pathlib import Path
 
 import logging
-from typing import Union
+from typing import Union, Type
 
 _logger = logging.getLogger("spicelib.SimRunner")
 
@@ -139,18 +139,37 @@ class SimRunner(SimRunnerBase):
         # This is a good practice to avoid confusion.
 
         # Gets a simulator.
-        from ..sim.ltspice_simulator import LTspice  # Used for defaults
-        if simulator is None:
-            simulator = LTspice
-        elif isinstance(simulator, (str, Path)):
-            simulator = LTspice.create_from(simulator)
-        elif issubclass(simulator, Simulator):
-            simulator = simulator
-        else:
-            simulator = LTspice
+        simulator = self._get_simulator(simulator)
         super().__init__(simulator=simulator, parallel_sims=parallel_sims, timeout=timeout, verbose=verbose,
                          output_folder=output_folder)
 
+    @staticmethod
+    def _get_simulator(spice_tool) -> Type[Simulator]:
+        """Internal function. Converts the simulator argument into a Simulator class."""
+        from ..sim.ltspice_simulator import LTspice  # Used for defaults
+        if spice_tool is None:
+            return LTspice
+        elif isinstance(spice_tool, (str, Path)):
+            # create_from() stores the executable on the class it is called from. Deriving a new class keeps the
+            # executable local to this runner, instead of changing the LTspice class used everywhere else.
+            return type(LTspice.__name__, (LTspice,), {}).create_from(spice_tool)
+        elif issubclass(spice_tool, Simulator):
+            return spice_tool
+        else:
+            return LTspice
+
+    def set_run_command(self, spice_tool: Union[str, Path, Type[Simulator]]) -> None:
+        """
+        Manually setting the simulator to be used. Contrary to set_simulator(), it also accepts the path to the
+        simulator executable. The setting only affects this runner.
+
+        :param spice_tool: String containing the path to the spice tool to be used, or alternatively the Simulator
+                           object.
+        :type spice_tool: str, Path or Simulator
+        :return: Nothing
+        """
+        self.simulator = self._get_simulator(spice_tool)
+
     def create_netlist(self, asc_file: Union[str, Path], cmd_line_args: list = None):
         """Creates a .net from an .asc using the LTSpice -netlist command line"""
         if not isinstance(asc_file, Path):
@@ -17,7 +17,103 @@
 #
 # -------------------------------------------------------------------------------
 
+import math
+from typing import Union
+
+import numpy as np
+
 from spicelib.utils.sweep_iterators import *
+from spicelib.utils.sweep_iterators import sweep as _sweep
+
+
+def _number_of_points(start: Union[int, float], stop: Union[int, float], step: Union[int, float]) -> int:
+    """Internal function. Number of points of a linear sweep, where the step already has the direction of the sweep.
+    The small margin avoids losing the last point to rounding errors."""
+    return int(math.floor((stop - start) / step + 1e-9)) + 1
+
+
+class sweep(_sweep):
+    """
+    Generator function to be used in sweeps.
+    Contrary to the spicelib implementation, the number of points is computed when the iterator is created, instead of
+    comparing each value against the stop value. This way the last point isn't lost to rounding errors.
+    Usage:
+        >>> list(sweep(0, 0.3, 0.1))
+        [0.0, 0.1, 0.2, 0.30000000000000004]
+        >>> list(sweep(0.3, 0, 0.1))
+        [0.3, 0.19999999999999998, 0.09999999999999998, -5.551115123125783e-17]
+    """
+
+    def __init__(self, start: Union[int, float], stop: Union[int, float] = None, step: Union[int, float] = 1):
+        super().__init__(start, stop, step)
+        self.npoints = _number_of_points(self.start, self.stop, self.step)
+
+    def __next__(self):
+        if self.niter < self.npoints:
+            val = self.start + self.niter * self.step
+            self.niter += 1
+            return val
+        else:
+            self.finished = True
+            raise StopIteration
+
+
+def sweep_n(start: Union[int, float], stop: Union[int, float], N: int) -> sweep:
+    """
+    Generator function that generates a 'N' number of points between a start and a stop interval.
+    Usage:
+        >>> list(sweep_n(0.3, 1.1, 5))
+        [0.3, 0.5, 0.7, 0.9000000000000001, 1.1]
+    """
+    return sweep(start, stop, (stop - start) / (N - 1))
+
+
+def sweep_array(start: Union[int, float], stop: Union[int, float] = None, step: Union[int, float] = 1) -> np.ndarray:
+    """
+    Vectorized version of the sweep iterator. It accepts the same arguments and follows the same rules for the sweep
+    direction, but returns all the points at once as a numpy array. This is preferred over list(sweep(...)) when
+    the sweep is large or when the values are going to be used in numpy calculations.
+    Usage:
+        >>> sweep_array(0.3, 1.1, 0.2)
+        array([0.3, 0.5, 0.7, 0.9, 1.1])
+        >>> sweep_array(8, 2, 2)
+        array([8, 6, 4, 2])
+    """
+    if stop is None:
+        start, stop = 0, start
+    if step == 0:
+        raise ValueError("Step cannot be 0")
+    if step < 0 and start < stop:
+        # The sign of the step determines whether it counts up or down.
+        start, stop = stop, start
+    elif step > 0 and stop < start:
+        step = -step
+    return start + np.arange(_number_of_points(start, stop, step)) * step
+
+
+def sweep_log_array(start: Union[int, float], stop: Union[int, float] = None,
+                    step: Union[int, float] = 10) -> np.ndarray:
+    """
+    Vectorized version of the sweep_log iterator. It accepts the same arguments and follows the same rules for the
+    sweep direction, but returns all the points at once as a numpy array.
+    Usage:
+        >>> sweep_log_array(0.1, 11e3, 10)
+        array([1.e-01, 1.e+00, 1.e+01, 1.e+02, 1.e+03, 1.e+04])
+        >>> sweep_log_array(1000, 1, 2)
+        array([1000.      ,  500.      ,  250.      ,  125.      ,   62.5     ,
+                 31.25    ,   15.625   ,    7.8125  ,    3.90625 ,    1.953125])
+    """
+    if stop is None:
+        start, stop = 1, start
+    if step <= 0 or step == 1:
+        raise ValueError("Step must be higher than 0 and not 1")
+    if start < stop and step < 1:
+        start, stop = stop, start
+    elif stop < start and step > 1:
+        step = 1 / step
+    npoints = int(math.floor(math.log(stop / start) / math.log(step) + 1e-9)) + 1
+    return start * np.power(float(step), np.arange(npoints))
+
 
 # ======================== Andreas Kaeberlein Iterator =========================
 
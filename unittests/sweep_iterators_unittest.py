@@ -26,6 +26,7 @@ import unittest   # performs test
 # Module libs
 sys.path.append(os.path.abspath((os.path.dirname(os.path.abspath(__file__)) + "/../")))   # add project root to lib search path
 from PyLTSpice.utils.sweep_iterators import sweep, sweep_n, sweep_log, sweep_log_n, sweep_iterators  # Python Script under test
+from PyLTSpice.utils.sweep_iterators import sweep_array, sweep_log_array
 #------------------------------------------------------------------------------
 
 
@@ -143,6 +144,43 @@ class test_sweep_iterators(unittest.TestCase):
                              [10.0, 5.623413251903491, 3.1622776601683795, 1.7782794100389228, 1]):
             self.assertAlmostEqual(a, b)
 
+    def test_sweep_endpoints(self):
+        """
+        @note  sweep endpoints with rounding errors
+        """
+        # *****************************
+        # check
+        self.assertEqual(len(list(sweep(0, 0.3, 0.1))), 4)
+        self.assertEqual(len(list(sweep(0.3, 0, 0.1))), 4)
+        self.assertEqual(len(list(sweep(0, 0.3, -0.1))), 4)
+        self.assertEqual(len(list(sweep(0, 1, 0.1))), 11)
+        self.assertEqual(len(list(sweep_n(0, 0.3, 4))), 4)
+        self.assertAlmostEqual(list(sweep(0, 0.3, 0.1))[-1], 0.3)
+        self.assertAlmostEqual(list(sweep(0.3, 0, 0.1))[-1], 0.0)
+        # the iterator can be reused
+        dut = sweep(1, 2, 0.5)
+        self.assertListEqual(list(dut), [1, 1.5, 2])
+        self.assertListEqual(list(dut), [1, 1.5, 2])
+
+    def test_array_sweeps(self):
+        """
+        @note  sweep_array, sweep_log_array
+        """
+        # *****************************
+        # check that the vectorized versions match the iterator objects
+        for args in ((10,), (1, 8), (2, 8, 2), (2, 8, -2), (8, 2, 2), (0.3, 1.1, 0.2), (15, -15, 2.5), (-2, 2, -2)):
+            expected = list(sweep(*args))
+            self.assertEqual(len(sweep_array(*args)), len(expected))
+            for a, b in zip(sweep_array(*args), expected):
+                self.assertAlmostEqual(a, b)
+        for args in ((0.1, 11e3, 10), (1000, 1, 2), (100,)):
+            expected = list(sweep_log(*args))
+            self.assertEqual(len(sweep_log_array(*args)), len(expected))
+            for a, b in zip(sweep_log_array(*args), expected):
+                self.assertAlmostEqual(a, b)
+        self.assertRaises(ValueError, sweep_array, 1, 2, 0)
+        self.assertRaises(ValueError, sweep_log_array, 1, 2, 1)
+
 
 #------------------------------------------------------------------------------
 if __name__ == '__main__':
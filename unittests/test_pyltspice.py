@@ -487,7 +487,19 @@ class test_pyltspice(unittest.TestCase):
                 self.assertAlmostEqual(angle(vout), angle(h), 5,
                                        f"Difference between theoretical value ans simulation at point {point}")
 
-    # 
+    @unittest.skipIf(False, "Execute All")
+    def test_run_command_is_per_runner(self):
+        """Setting the simulator executable on one runner doesn't change the LTspice class"""
+        from pathlib import Path
+        from PyLTSpice.sim.ltspice_simulator import LTspice
+        default_exe = list(LTspice.spice_exe)
+        runner = SimRunner(simulator=sys.executable, output_folder=test_dir)
+        self.assertEqual(runner.simulator.spice_exe, [Path(sys.executable).as_posix()])
+        self.assertEqual(LTspice.spice_exe, default_exe)
+        runner.set_run_command(LTspice)
+        self.assertIs(runner.simulator, LTspice)
+
+    #
     # def test_pathlib(self):
     #     """pathlib support"""
     #     import pathlib